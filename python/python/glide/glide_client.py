@@ -1,12 +1,16 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
 
+import socket
 import sys
 import threading
+from collections import deque
+from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
     Awaitable,
-    Dict,
+    Deque,
+    Iterable,
     List,
     Optional,
     Set,
@@ -19,13 +23,21 @@ from typing import (
 import anyio
 import sniffio
 from anyio import to_thread
+from anyio.abc import SocketAttribute
+from google.protobuf.internal import api_implementation
 
 from glide.async_commands.cluster_commands import ClusterCommands
 from glide.async_commands.command_args import ObjectType
 from glide.async_commands.core import CoreCommands
 from glide.async_commands.standalone_commands import StandaloneCommands
 from glide.config import BaseClientConfiguration, ServerCredentials
-from glide.constants import DEFAULT_READ_BYTES_SIZE, OK, TEncodable, TRequest, TResult
+from glide.constants import (
+    DEFAULT_READ_BYTES_SIZE,
+    OK,
+    TEncodable,
+    TRequest,
+    TResult,
+)
 from glide.exceptions import (
     ClosingError,
     ConfigurationError,
@@ -65,6 +77,17 @@ if TYPE_CHECKING:
     TTask = Union[asyncio.Task[None], trio.lowlevel.Task]
     TFuture = Union[asyncio.Future[Any], "_CompatFuture"]
 
+# push notification kinds as tagged by `push_kind_to_id` in src/lib.rs; kinds unknown to
+# the core are passed by name instead
+_PUSH_KIND_DISCONNECTION = 0
+_PUSH_KIND_MESSAGE = 1
+_PUSH_KIND_PMESSAGE = 2
+_PUSH_KIND_SMESSAGE = 3
+# Subscribe, PSubscribe, SSubscribe, Unsubscribe, PUnsubscribe and SUnsubscribe
+_SUBSCRIPTION_PUSH_KINDS = frozenset(range(4, 10))
+# client-side caching invalidation, which isn't supported by this client
+_PUSH_KIND_INVALIDATE = 10
+
 
 def get_request_error_class(
     error_type: Optional[RequestErrorType.ValueType],
@@ -83,6 +106,8 @@ def get_request_error_class(
 class _CompatFuture:
     """anyio shim for asyncio.Future-like functionality"""
 
+    __slots__ = ("_is_done", "_result", "_exception")
+
     def __init__(self) -> None:
         self._is_done = anyio.Event()
         self._result: Any = None
@@ -127,16 +152,19 @@ class BaseClient(CoreCommands):
         To create a new client, use the `create` classmethod
         """
         self.config: BaseClientConfiguration = config
-        self._available_futures: Dict[int, "TFuture"] = {}
+        # indexed directly by callback index, which are small recycled integers
+        self._available_futures: List[Optional["TFuture"]] = list()
         self._available_callback_indexes: List[int] = list()
-        self._buffered_requests: List[TRequest] = list()
-        self._writer_lock = threading.Lock()
+        self._buffered_requests: List[bytearray] = list()
+        self._writer_lock = anyio.Lock(fast_acquire=True)
         self.socket_path: Optional[str] = None
+        # the stream's underlying socket, used to write requests inline when idle
+        self._raw_socket: Optional[socket.socket] = None
         self._reader_task: Optional["TTask"] = None
         self._is_closed: bool = False
-        self._pubsub_futures: List["TFuture"] = []
-        self._pubsub_lock = threading.Lock()
-        self._pending_push_notifications: List[Response] = list()
+        self._pubsub_futures: Deque["TFuture"] = deque()
+        self._pubsub_lock = anyio.Lock(fast_acquire=True)
+        self._pending_push_notifications: Deque[Response] = deque()
 
         self._pending_tasks: Optional[Set[Awaitable[None]]] = None
         """asyncio-only to avoid gc on pending write tasks"""
@@ -260,6 +288,15 @@ class BaseClient(CoreCommands):
         # will log if the logger was created (wrapper or costumer) on info
         # level or higher
         ClientLogger.log(LogLevel.INFO, "connection info", "new connection established")
+        if api_implementation.Type() == "python":
+            # every request and response goes through protobuf, so the pure-Python
+            # runtime is a significant bottleneck compared to the upb/cpp backends
+            ClientLogger.log(
+                LogLevel.WARN,
+                "protobuf implementation",
+                "The pure-Python protobuf runtime is in use, which severely limits throughput. "
+                "Install protobuf>=4.21 or set PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=upb.",
+            )
         # Wait for the socket listener to complete its initialization
         await to_thread.run_sync(init_event.wait)
         # Create UDS connection
@@ -280,6 +317,7 @@ class BaseClient(CoreCommands):
                 self._stream = await anyio.connect_unix(
                     path=cast(str, self.socket_path)
                 )
+            self._raw_socket = self._stream.extra(SocketAttribute.raw_socket)
         except Exception as e:
             raise ClosingError("Failed to create UDS connection") from e
 
@@ -296,22 +334,27 @@ class BaseClient(CoreCommands):
         if not self._is_closed:
             self._is_closed = True
             err_message = "" if err_message is None else err_message
-            for response_future in self._available_futures.values():
-                if not response_future.done():
+            for response_future in self._available_futures:
+                if response_future is not None and not response_future.done():
                     response_future.set_exception(ClosingError(err_message))
-            try:
-                self._pubsub_lock.acquire()
+            async with self._pubsub_lock:
                 for pubsub_future in self._pubsub_futures:
                     if not pubsub_future.done():
                         pubsub_future.set_exception(ClosingError(err_message))
-            finally:
-                self._pubsub_lock.release()
 
             await self._stream.aclose()
 
     def _get_future(self, callback_idx: int) -> "TFuture":
         response_future: "TFuture" = _get_new_future_instance()
-        self._available_futures.update({callback_idx: response_future})
+        self._available_futures[callback_idx] = response_future
+        return response_future
+
+    def _pop_future(self, callback_idx: int) -> Optional["TFuture"]:
+        try:
+            response_future = self._available_futures[callback_idx]
+        except IndexError:
+            return None
+        self._available_futures[callback_idx] = None
         return response_future
 
     def _get_protobuf_conn_request(self) -> ConnectionRequest:
@@ -319,7 +362,8 @@ class BaseClient(CoreCommands):
 
     async def _set_connection_configurations(self) -> None:
         conn_request = self._get_protobuf_conn_request()
-        response_future: "TFuture" = self._get_future(0)
+        # this is the client's first request, so it is allocated callback index 0
+        response_future: "TFuture" = self._get_future(self._get_callback_index())
         self._create_write_task(conn_request)
         await response_future
         res = response_future.result()
@@ -327,39 +371,65 @@ class BaseClient(CoreCommands):
             raise ClosingError(res)
 
     def _create_write_task(self, request: TRequest):
-        self._create_task(self._write_or_buffer_request, request)
-
-    async def _write_or_buffer_request(self, request: TRequest):
-        self._buffered_requests.append(request)
-        if self._writer_lock.acquire(False):
+        # serialize right away so that only the encoded bytes are buffered and the
+        # writer just has to concatenate them
+        b_arr = bytearray()
+        ProtobufCodec.encode_delimited(b_arr, request)
+        callback_idx = (
+            request.callback_idx if isinstance(request, CommandRequest) else 0
+        )
+        if (
+            self._raw_socket is not None
+            and not self._buffered_requests
+            and not self._writer_lock.locked()
+        ):
+            # nothing is queued or in flight, so try to write the request straight
+            # to the (non-blocking) socket and skip spawning a writer task
             try:
-                while len(self._buffered_requests) > 0:
-                    await self._write_buffered_requests_to_socket()
-            except Exception as e:
-                # trio system tasks cannot raise exceptions, so gracefully propagate
-                # any error to the pending future instead
-                callback_idx = (
-                    request.callback_idx if isinstance(request, CommandRequest) else 0
+                sent = self._raw_socket.send(b_arr)
+            except OSError:
+                # includes BlockingIOError; the writer task will retry the send
+                # through the stream and report any real error
+                sent = 0
+            if sent == len(b_arr):
+                return
+            b_arr = b_arr[sent:]
+        # buffer synchronously so that requests are written in submission order
+        self._buffered_requests.append(b_arr)
+        self._create_task(self._write_buffered_requests, callback_idx)
+
+    async def _write_buffered_requests(self, callback_idx: int):
+        try:
+            self._writer_lock.acquire_nowait()
+        except anyio.WouldBlock:
+            # the current writer will flush this request along with its batch
+            return
+        try:
+            while len(self._buffered_requests) > 0:
+                await self._write_buffered_requests_to_socket()
+        except Exception as e:
+            # trio system tasks cannot raise exceptions, so gracefully propagate
+            # any error to the pending future instead
+            res_future = self._pop_future(callback_idx)
+            if res_future:
+                res_future.set_exception(e)
+            else:
+                ClientLogger.log(
+                    LogLevel.WARN,
+                    "unhandled response error",
+                    f"Unhandled response error for unknown request: {callback_idx}",
                 )
-                res_future = self._available_futures.pop(callback_idx, None)
-                if res_future:
-                    res_future.set_exception(e)
-                else:
-                    ClientLogger.log(
-                        LogLevel.WARN,
-                        "unhandled response error",
-                        f"Unhandled response error for unknown request: {callback_idx}",
-                    )
-            finally:
-                self._writer_lock.release()
+        finally:
+            self._writer_lock.release()
 
     async def _write_buffered_requests_to_socket(self) -> None:
         requests = self._buffered_requests
         self._buffered_requests = list()
-        b_arr = bytearray()
-        for request in requests:
-            ProtobufCodec.encode_delimited(b_arr, request)
-        await self._stream.send(b_arr)
+        if len(requests) == 1:
+            await self._stream.send(requests[0])
+            return
+        # join the batch into one payload so that it is written with a single send
+        await self._stream.send(b"".join(requests))
 
     def _encode_arg(self, arg: TEncodable) -> bytes:
         """
@@ -373,32 +443,68 @@ class BaseClient(CoreCommands):
         """
         if isinstance(arg, str):
             # TODO: Allow passing different encoding options
-            return bytes(arg, encoding="utf8")
+            return arg.encode("utf-8")
         return arg
 
+    def _encode_args(self, args: Iterable[TEncodable]) -> List[bytes]:
+        """
+        Converts the string arguments to bytes, passing bytes arguments through as is.
+
+        Args:
+            args (Iterable[TEncodable]): The encodable arguments.
+
+        Returns:
+            List[bytes]: The encoded arguments as bytes.
+        """
+        # the exact type checks are only fast paths, str subclasses (e.g. str enums)
+        # still have to be encoded by _encode_arg
+        return [
+            (
+                arg.encode("utf-8")
+                if type(arg) is str
+                else arg if type(arg) is bytes else self._encode_arg(arg)
+            )
+            for arg in args
+        ]
+
     def _encode_and_sum_size(
         self,
         args_list: Optional[List[TEncodable]],
     ) -> Tuple[List[bytes], int]:
         """
-        Encodes the list and calculates the total memory size.
+        Encodes the list and calculates the total payload size.
 
         Args:
             args_list (Optional[List[TEncodable]]): A list of strings to be converted to bytes.
                                                            If None or empty, returns ([], 0).
 
         Returns:
-            int: The total memory size of the encoded arguments in bytes.
+            Tuple[List[bytes], int]: The encoded arguments and their total length in bytes.
         """
-        args_size = 0
-        encoded_args_list: List[bytes] = []
         if not args_list:
-            return (encoded_args_list, args_size)
-        for arg in args_list:
-            encoded_arg = self._encode_arg(arg) if isinstance(arg, str) else arg
-            encoded_args_list.append(encoded_arg)
-            args_size += sys.getsizeof(encoded_arg)
-        return (encoded_args_list, args_size)
+            return ([], 0)
+        encoded_args_list = self._encode_args(args_list)
+        return (encoded_args_list, sum(map(len, encoded_args_list)))
+
+    def _encode_keys_and_args(
+        self,
+        keys: Optional[List[TEncodable]],
+        args: Optional[List[TEncodable]],
+    ) -> Tuple[List[bytes], List[bytes], int]:
+        """
+        Encodes the keys and args of a script invocation in a single pass and calculates their total payload size.
+
+        Args:
+            keys (Optional[List[TEncodable]]): The script keys to be converted to bytes.
+            args (Optional[List[TEncodable]]): The script args to be converted to bytes.
+
+        Returns:
+            Tuple[List[bytes], List[bytes], int]: The encoded keys, the encoded args and their total length in bytes.
+        """
+        keys = keys or []
+        encoded = self._encode_args(chain(keys, args or ()))
+        keys_count = len(keys)
+        return (encoded[:keys_count], encoded[keys_count:], sum(map(len, encoded)))
 
     async def _execute_command(
         self,
@@ -413,13 +519,9 @@ class BaseClient(CoreCommands):
         request = CommandRequest()
         request.callback_idx = self._get_callback_index()
         request.single_command.request_type = request_type
-        request.single_command.args_array.args[:] = [
-            bytes(elem, encoding="utf8") if isinstance(elem, str) else elem
-            for elem in args
-        ]
         (encoded_args, args_size) = self._encode_and_sum_size(args)
         if args_size < MAX_REQUEST_ARGS_LEN:
-            request.single_command.args_array.args[:] = encoded_args
+            request.single_command.args_array.args.extend(encoded_args)
         else:
             request.single_command.args_vec_pointer = create_leaked_bytes_vec(
                 encoded_args
@@ -451,7 +553,7 @@ class BaseClient(CoreCommands):
             # we convert them here into bytes (the datatype that our rust core expects)
             (encoded_args, args_size) = self._encode_and_sum_size(args)
             if args_size < MAX_REQUEST_ARGS_LEN:
-                command.args_array.args[:] = encoded_args
+                command.args_array.args.extend(encoded_args)
             else:
                 command.args_vec_pointer = create_leaked_bytes_vec(encoded_args)
             batch_commands.append(command)
@@ -478,12 +580,11 @@ class BaseClient(CoreCommands):
             )
         request = CommandRequest()
         request.callback_idx = self._get_callback_index()
-        (encoded_keys, keys_size) = self._encode_and_sum_size(keys)
-        (encoded_args, args_size) = self._encode_and_sum_size(args)
-        if (keys_size + args_size) < MAX_REQUEST_ARGS_LEN:
+        (encoded_keys, encoded_args, args_size) = self._encode_keys_and_args(keys, args)
+        if args_size < MAX_REQUEST_ARGS_LEN:
             request.script_invocation.hash = hash
-            request.script_invocation.keys[:] = encoded_keys
-            request.script_invocation.args[:] = encoded_args
+            request.script_invocation.keys.extend(encoded_keys)
+            request.script_invocation.args.extend(encoded_args)
 
         else:
             request.script_invocation_pointers.hash = hash
@@ -514,12 +615,9 @@ class BaseClient(CoreCommands):
 
         # locking might not be required
         response_future: "TFuture" = _get_new_future_instance()
-        try:
-            self._pubsub_lock.acquire()
+        async with self._pubsub_lock:
             self._pubsub_futures.append(response_future)
             self._complete_pubsub_futures_safe()
-        finally:
-            self._pubsub_lock.release()
         await response_future
         return response_future.result()
 
@@ -541,11 +639,13 @@ class BaseClient(CoreCommands):
 
         # locking might not be required
         msg: Optional[CoreCommands.PubSubMsg] = None
+        # the lock is never held across an await, so it is always free when a
+        # synchronous caller runs
+        self._pubsub_lock.acquire_nowait()
         try:
-            self._pubsub_lock.acquire()
             self._complete_pubsub_futures_safe()
             while len(self._pending_push_notifications) and not msg:
-                push_notification = self._pending_push_notifications.pop(0)
+                push_notification = self._pending_push_notifications.popleft()
                 msg = self._notification_to_pubsub_message_safe(push_notification)
         finally:
             self._pubsub_lock.release()
@@ -553,63 +653,53 @@ class BaseClient(CoreCommands):
 
     def _cancel_pubsub_futures_with_exception_safe(self, exception: ConnectionError):
         while len(self._pubsub_futures):
-            next_future = self._pubsub_futures.pop(0)
+            next_future = self._pubsub_futures.popleft()
             next_future.set_exception(exception)
 
     def _notification_to_pubsub_message_safe(
         self, response: Response
     ) -> Optional[CoreCommands.PubSubMsg]:
         pubsub_message = None
-        push_notification = cast(
-            Dict[str, Any], value_from_pointer(response.resp_pointer)
+        push_kind, values = cast(
+            Tuple[Union[int, str], List], value_from_pointer(response.resp_pointer)
         )
-        message_kind = push_notification["kind"]
-        if message_kind == "Disconnection":
+        # messages are by far the most frequent notifications, so test them first
+        if push_kind == _PUSH_KIND_MESSAGE or push_kind == _PUSH_KIND_SMESSAGE:
+            pubsub_message = BaseClient.PubSubMsg(
+                message=values[1], channel=values[0], pattern=None
+            )
+        elif push_kind == _PUSH_KIND_PMESSAGE:
+            pubsub_message = BaseClient.PubSubMsg(
+                message=values[2], channel=values[1], pattern=values[0]
+            )
+        elif push_kind in _SUBSCRIPTION_PUSH_KINDS:
+            pass
+        elif push_kind == _PUSH_KIND_DISCONNECTION:
             ClientLogger.log(
                 LogLevel.WARN,
                 "disconnect notification",
                 "Transport disconnected, messages might be lost",
             )
-        elif (
-            message_kind == "Message"
-            or message_kind == "PMessage"
-            or message_kind == "SMessage"
-        ):
-            values: List = push_notification["values"]
-            if message_kind == "PMessage":
-                pubsub_message = BaseClient.PubSubMsg(
-                    message=values[2], channel=values[1], pattern=values[0]
-                )
-            else:
-                pubsub_message = BaseClient.PubSubMsg(
-                    message=values[1], channel=values[0], pattern=None
-                )
-        elif (
-            message_kind == "PSubscribe"
-            or message_kind == "Subscribe"
-            or message_kind == "SSubscribe"
-            or message_kind == "Unsubscribe"
-            or message_kind == "PUnsubscribe"
-            or message_kind == "SUnsubscribe"
-        ):
-            pass
         else:
+            kind_name = (
+                "Invalidate" if push_kind == _PUSH_KIND_INVALIDATE else push_kind
+            )
             ClientLogger.log(
                 LogLevel.WARN,
                 "unknown notification",
-                f"Unknown notification message: '{message_kind}'",
+                f"Unknown notification message: '{kind_name}'",
             )
 
         return pubsub_message
 
     def _complete_pubsub_futures_safe(self):
         while len(self._pending_push_notifications) and len(self._pubsub_futures):
-            next_push_notification = self._pending_push_notifications.pop(0)
+            next_push_notification = self._pending_push_notifications.popleft()
             pubsub_message = self._notification_to_pubsub_message_safe(
                 next_push_notification
             )
             if pubsub_message:
-                self._pubsub_futures.pop(0).set_result(pubsub_message)
+                self._pubsub_futures.popleft().set_result(pubsub_message)
 
     async def _write_request_await_response(self, request: CommandRequest):
         # Create a response future for this request and add it to the available
@@ -623,15 +713,19 @@ class BaseClient(CoreCommands):
         try:
             return self._available_callback_indexes.pop()
         except IndexError:
-            # The list is empty
-            return len(self._available_futures)
+            # The list is empty, so grow the futures list by a new slot
+            self._available_futures.append(None)
+            return len(self._available_futures) - 1
 
     async def _process_response(self, response: Response) -> None:
-        res_future = self._available_futures.pop(response.callback_idx, None)
-        if not res_future or response.HasField("closing_error"):
+        res_future = self._pop_future(response.callback_idx)
+        # the response fields form the `value` oneof, so a single lookup tells
+        # which one is set
+        value_field = response.WhichOneof("value")
+        if not res_future or value_field == "closing_error":
             err_msg = (
                 response.closing_error
-                if response.HasField("closing_error")
+                if value_field == "closing_error"
                 else f"Client Error - closing due to unknown error. callback index:  {response.callback_idx}"
             )
             exc = ClosingError(err_msg)
@@ -646,41 +740,41 @@ class BaseClient(CoreCommands):
             raise exc
         else:
             self._available_callback_indexes.append(response.callback_idx)
-            if response.HasField("request_error"):
+            if value_field == "request_error":
                 error_type = get_request_error_class(response.request_error.type)
                 res_future.set_exception(error_type(response.request_error.message))
-            elif response.HasField("resp_pointer"):
+            elif value_field == "resp_pointer":
                 res_future.set_result(value_from_pointer(response.resp_pointer))
-            elif response.HasField("constant_response"):
+            elif value_field == "constant_response":
                 res_future.set_result(OK)
             else:
                 res_future.set_result(None)
 
     async def _process_push(self, response: Response) -> None:
-        if response.HasField("closing_error") or not response.HasField("resp_pointer"):
+        value_field = response.WhichOneof("value")
+        if value_field != "resp_pointer":
             err_msg = (
                 response.closing_error
-                if response.HasField("closing_error")
+                if value_field == "closing_error"
                 else "Client Error - push notification without resp_pointer"
             )
             raise ClosingError(err_msg)
-        try:
-            self._pubsub_lock.acquire()
-            callback, context = self.config._get_pubsub_callback_and_context()
-            if callback:
-                pubsub_message = self._notification_to_pubsub_message_safe(response)
-                if pubsub_message:
-                    callback(pubsub_message, context)
-            else:
+        callback, context = self.config._get_pubsub_callback_and_context()
+        if callback:
+            # no shared pubsub state is touched when delivering to a callback
+            pubsub_message = self._notification_to_pubsub_message_safe(response)
+            if pubsub_message:
+                callback(pubsub_message, context)
+        else:
+            async with self._pubsub_lock:
                 self._pending_push_notifications.append(response)
                 self._complete_pubsub_futures_safe()
-        finally:
-            self._pubsub_lock.release()
 
     async def _reader_loop(self) -> None:
         # Socket reader loop
         try:
-            remaining_read_bytes = bytearray()
+            # holds a trailing partial response until the rest of it is received
+            read_buffer = bytearray()
             while True:
                 try:
                     read_bytes = await self._stream.receive(DEFAULT_READ_BYTES_SIZE)
@@ -688,23 +782,32 @@ class BaseClient(CoreCommands):
                     raise ClosingError(
                         "The communication layer was unexpectedly closed."
                     )
-                read_bytes = remaining_read_bytes + bytearray(read_bytes)
-                read_bytes_view = memoryview(read_bytes)
+                if read_buffer:
+                    # complete the partial response left over from the previous read,
+                    # otherwise parse the received bytes directly without copying
+                    read_buffer += read_bytes
+                    read_bytes = read_buffer
                 offset = 0
-                while offset <= len(read_bytes):
-                    try:
-                        response, offset = ProtobufCodec.decode_delimited(
-                            read_bytes, read_bytes_view, offset, Response
-                        )
-                    except PartialMessageException:
-                        # Received only partial response, break the inner loop
-                        remaining_read_bytes = read_bytes[offset:]
-                        break
-                    response = cast(Response, response)
-                    if response.is_push:
-                        await self._process_push(response=response)
-                    else:
-                        await self._process_response(response=response)
+                # the view must be released before the buffer can be resized
+                with memoryview(read_bytes) as read_bytes_view:
+                    while offset <= len(read_bytes):
+                        try:
+                            response, offset = ProtobufCodec.decode_delimited(
+                                read_bytes, read_bytes_view, offset, Response
+                            )
+                        except PartialMessageException:
+                            # Received only partial response, break the inner loop
+                            break
+                        response = cast(Response, response)
+                        if response.is_push:
+                            await self._process_push(response=response)
+                        else:
+                            await self._process_response(response=response)
+                # keep only the trailing partial response, if any
+                if read_bytes is read_buffer:
+                    del read_buffer[:offset]
+                else:
+                    read_buffer += read_bytes[offset:]
         except Exception as e:
             # close and stop reading at terminal exceptions from incoming responses or
             # stream closures
@@ -757,9 +860,7 @@ class GlideClusterClient(BaseClient, ClusterCommands):
         request.cluster_scan.cursor = cursor_string
         request.cluster_scan.allow_non_covered_slots = allow_non_covered_slots
         if match is not None:
-            request.cluster_scan.match_pattern = (
-                self._encode_arg(match) if isinstance(match, str) else match
-            )
+            request.cluster_scan.match_pattern = self._encode_arg(match)
         if count is not None:
             request.cluster_scan.count = count
         if type is not None:
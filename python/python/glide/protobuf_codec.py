@@ -1,7 +1,7 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
 
 import struct
-from typing import List, Tuple, Type
+from typing import List, Tuple, Type, Union
 
 from google.protobuf import message
 
@@ -74,7 +74,7 @@ class ProtobufCodec:
     @classmethod
     def decode_delimited(
         cls,
-        read_bytes: bytearray,
+        read_bytes: Union[bytes, bytearray],
         read_bytes_view: memoryview,
         offset: int,
         message_class: Type[message.Message],
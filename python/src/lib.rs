@@ -10,7 +10,7 @@ use pyo3::Python;
 use pyo3::exceptions::PyTypeError;
 use pyo3::prelude::*;
 use pyo3::types::{PyAny, PyBool, PyBytes, PyDict, PyFloat, PyList, PySet, PyString};
-use redis::Value;
+use redis::{PushKind, Value};
 use std::collections::HashMap;
 use std::ptr::from_mut;
 use std::sync::Arc;
@@ -301,15 +301,23 @@ fn glide(_py: Python, m: &Bound<PyModule>) -> PyResult<()> {
                 .into_any()
                 .unbind()),
             Value::Push { kind, data } => {
-                let dict = PyDict::new(py);
-                dict.set_item("kind", format!("{kind:?}"))?;
                 let values: Bound<PyList> = PyList::new(py, iter_to_value(py, data)?)?;
-                dict.set_item("values", values)?;
-                Ok(dict
-                    .into_pyobject(py)
-                    .expect("Push: expected a proper conversion into a Python dict.")
-                    .into_any()
-                    .unbind())
+                let kind: PyObject = match push_kind_to_id(&kind) {
+                    Some(kind_id) => kind_id
+                        .into_pyobject(py)
+                        .expect("Push: expected a proper conversion of the kind into a Python int.")
+                        .into_any()
+                        .unbind(),
+                    // unknown kinds keep their name so that they can still be reported
+                    None => format!("{kind:?}")
+                        .into_pyobject(py)
+                        .expect(
+                            "Push: expected a proper conversion of the kind into a Python string.",
+                        )
+                        .into_any()
+                        .unbind(),
+                };
+                Ok((kind, values).into_pyobject(py)?.into_any().unbind())
             }
             Value::ServerError(error) => {
                 let err_msg = error_message(&error.into());
@@ -329,6 +337,26 @@ fn glide(_py: Python, m: &Bound<PyModule>) -> PyResult<()> {
         }
     }
 
+    /// Maps a push notification kind to the integer tag passed to Python, or `None` for
+    /// kinds that aren't known to the client.
+    /// Must be kept in sync with the `_PUSH_KIND_*` constants in `glide_client.py`.
+    fn push_kind_to_id(kind: &PushKind) -> Option<u8> {
+        match kind {
+            PushKind::Disconnection => Some(0),
+            PushKind::Message => Some(1),
+            PushKind::PMessage => Some(2),
+            PushKind::SMessage => Some(3),
+            PushKind::Subscribe => Some(4),
+            PushKind::PSubscribe => Some(5),
+            PushKind::SSubscribe => Some(6),
+            PushKind::Unsubscribe => Some(7),
+            PushKind::PUnsubscribe => Some(8),
+            PushKind::SUnsubscribe => Some(9),
+            PushKind::Invalidate => Some(10),
+            PushKind::Other(_) => None,
+        }
+    }
+
     #[pyfunction]
     pub fn value_from_pointer(py: Python, pointer: u64) -> PyResult<PyObject> {
         let value = unsafe { Box::from_raw(pointer as *mut Value) };
@@ -6,6 +6,7 @@ from __future__ import annotations
 import math
 import time
 from datetime import date, datetime, timedelta, timezone
+from enum import Enum
 from typing import Any, Dict, List, Mapping, Optional, Union, cast
 
 import anyio
@@ -389,6 +390,18 @@ class TestCommands:
         assert await glide_client.set(key, value) == OK
         assert await glide_client.get(key) == value.encode()
 
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_str_enum_args(self, glide_client: TGlideClient):
+        # str subclasses are valid TEncodable arguments and must still be encoded
+        Keys = Enum("Keys", {"KEY": get_random_string(10)}, type=str)
+        key = Keys.KEY
+        assert await glide_client.set(key, "value") == OK
+        assert await glide_client.get(key) == b"value"
+        # a str subclass following bytes arguments must not take the bytes-only path
+        assert await glide_client.custom_command([b"SET", key, b"bytes_value"]) == OK
+        assert await glide_client.custom_command([b"GET", key]) == b"bytes_value"
+
     @pytest.mark.parametrize("cluster_mode", [True, False])
     @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
     async def test_use_resp3_protocol(self, glide_client: TGlideClient):
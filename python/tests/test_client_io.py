@@ -0,0 +1,136 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+import os
+import socket
+import tempfile
+from itertools import cycle
+from typing import Iterator, List
+
+import anyio
+import pytest
+from anyio.abc import SocketAttribute
+
+from glide.config import GlideClusterClientConfiguration, NodeAddress
+from glide.constants import OK
+from glide.exceptions import RequestError
+from glide.glide_client import GlideClusterClient
+from glide.protobuf.command_request_pb2 import CommandRequest, RequestType
+from glide.protobuf.response_pb2 import ConstantResponse, Response
+from glide.protobuf_codec import ProtobufCodec
+
+
+class ChunkedStream:
+    """
+    A receive-only stream that returns the given chunks one per read, then reports the end of the stream.
+    """
+
+    def __init__(self, chunks: List[bytes]):
+        self._chunks: Iterator[bytes] = iter(chunks)
+
+    async def receive(self, max_bytes: int) -> bytes:
+        await anyio.sleep(0)
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise anyio.EndOfStream
+
+    async def aclose(self) -> None:
+        pass
+
+
+def create_unconnected_client() -> GlideClusterClient:
+    return GlideClusterClient(GlideClusterClientConfiguration([NodeAddress()]))
+
+
+@pytest.mark.anyio
+class TestClientIO:
+    async def test_reader_loop_split_responses(self):
+        client = create_unconnected_client()
+        responses_count = 3000
+        futures = [
+            client._get_future(client._get_callback_index())
+            for _ in range(responses_count)
+        ]
+        data = bytearray()
+        for callback_idx in range(responses_count):
+            response = Response()
+            response.callback_idx = callback_idx
+            if callback_idx % 2 == 0:
+                response.constant_response = ConstantResponse.OK
+            else:
+                # vary the response sizes so that the length prefix isn't always 1 byte
+                response.request_error.message = "e" * (callback_idx % 400)
+            ProtobufCodec.encode_delimited(data, response)
+
+        # split the data so that responses, and their length prefixes, span reads
+        chunks = []
+        chunk_sizes = cycle([1, 2, 7, 100, 997, 5000])
+        offset = 0
+        while offset < len(data):
+            end = offset + next(chunk_sizes)
+            chunks.append(bytes(data[offset:end]))
+            offset = end
+        client._stream = ChunkedStream(chunks)
+
+        # the loop closes the client once the stream ends
+        await client._reader_loop()
+
+        # responses free their callback index as they are processed
+        assert client._available_callback_indexes == list(range(responses_count))
+        for callback_idx, future in enumerate(futures):
+            if callback_idx % 2 == 0:
+                assert future.result() == OK
+            else:
+                with pytest.raises(RequestError) as e:
+                    future.result()
+                assert str(e.value) == "e" * (callback_idx % 400)
+
+    async def test_write_requests_in_order(self):
+        client = create_unconnected_client()
+        requests = []
+        expected = bytearray()
+        for _ in range(500):
+            request = CommandRequest()
+            request.callback_idx = client._get_callback_index()
+            request.single_command.request_type = RequestType.Set
+            # every fifth request is larger than the send buffer, so it can only be
+            # partially written inline
+            value_size = 20000 if request.callback_idx % 5 == 0 else 300
+            value = bytes([request.callback_idx % 256]) * value_size
+            request.single_command.args_array.args.extend([b"key", value])
+            client._get_future(request.callback_idx)
+            ProtobufCodec.encode_delimited(expected, request)
+            requests.append(request)
+
+        async def submit_all():
+            for i, request in enumerate(requests):
+                if i % 5 == 0:
+                    # wait for the writer to go idle, so that the next request is
+                    # written inline
+                    while client._buffered_requests or client._writer_lock.locked():
+                        await anyio.sleep(0)
+                client._create_write_task(request)
+                # interleave the submissions with the writer and the reader
+                for _ in range(i % 3):
+                    await anyio.sleep(0)
+
+        received = bytearray()
+        with tempfile.TemporaryDirectory() as socket_dir:
+            socket_path = os.path.join(socket_dir, "glide.sock")
+            async with await anyio.create_unix_listener(socket_path) as listener:
+                client._stream = await anyio.connect_unix(socket_path)
+                client._raw_socket = client._stream.extra(SocketAttribute.raw_socket)
+                # a small send buffer makes the large inline sends partial, so that the
+                # requests submitted after them have to queue behind the writer
+                client._raw_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+                async with await listener.accept() as server_stream:
+                    with anyio.fail_after(10):
+                        async with anyio.create_task_group() as tg:
+                            tg.start_soon(submit_all)
+                            while len(received) < len(expected):
+                                received.extend(await server_stream.receive())
+                await client._stream.aclose()
+
+        # every request arrives whole and in submission order, and none failed
+        assert received == expected
+        assert not any(future.done() for future in client._available_futures)
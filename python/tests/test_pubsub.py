@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import re
 from enum import IntEnum
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 import anyio
@@ -16,7 +18,17 @@ from glide.config import (
 )
 from glide.constants import OK
 from glide.exceptions import ConfigurationError
-from glide.glide_client import GlideClient, GlideClusterClient, TGlideClient
+from glide.glide_client import (
+    _PUSH_KIND_DISCONNECTION,
+    _PUSH_KIND_INVALIDATE,
+    _PUSH_KIND_MESSAGE,
+    _PUSH_KIND_PMESSAGE,
+    _PUSH_KIND_SMESSAGE,
+    _SUBSCRIPTION_PUSH_KINDS,
+    GlideClient,
+    GlideClusterClient,
+    TGlideClient,
+)
 from tests.conftest import create_client
 from tests.utils.utils import check_if_server_version_lt, get_random_string
 
@@ -2740,3 +2752,41 @@ class TestPubSub:
         finally:
             await client_cleanup(client1, pub_sub1 if cluster_mode else None)
             await client_cleanup(client2, pub_sub2 if cluster_mode else None)
+
+
+class TestPushKinds:
+    def test_push_kind_tags_match_core(self):
+        # the tags are assigned by `push_kind_to_id` in src/lib.rs, which has to be kept
+        # in sync with the `_PUSH_KIND_*` constants by hand
+        lib_file = Path(__file__).parent.parent / "src" / "lib.rs"
+        match = re.search(
+            r"fn push_kind_to_id\(.*?\{(.*?)\n    \}", lib_file.read_text(), re.S
+        )
+        assert match is not None
+        mapping = match.group(1)
+        rust_tags = {
+            kind: int(tag)
+            for kind, tag in re.findall(r"PushKind::(\w+) => Some\((\d+)\)", mapping)
+        }
+        # unknown kinds are passed by name
+        assert "PushKind::Other(_) => None" in mapping
+        assert len(set(rust_tags.values())) == len(rust_tags)
+
+        subscription_kinds = [
+            "Subscribe",
+            "PSubscribe",
+            "SSubscribe",
+            "Unsubscribe",
+            "PUnsubscribe",
+            "SUnsubscribe",
+        ]
+        assert {
+            rust_tags.pop(kind) for kind in subscription_kinds
+        } == _SUBSCRIPTION_PUSH_KINDS
+        assert rust_tags == {
+            "Disconnection": _PUSH_KIND_DISCONNECTION,
+            "Message": _PUSH_KIND_MESSAGE,
+            "PMessage": _PUSH_KIND_PMESSAGE,
+            "SMessage": _PUSH_KIND_SMESSAGE,
+            "Invalidate": _PUSH_KIND_INVALIDATE,
+        }